@@ -4,15 +4,18 @@ from numbers import Number
 from typing import Any, Optional, Tuple, Union
 
 import jax.numpy as jnp
+import numpy as np
 from chex import Array, assert_equal_shape, assert_rank
 from einops import rearrange
 from flax import struct
+from jax import lax
 
 from .utils.shapes import (
     _broadcast_1d_to_channels,
     _broadcast_1d_to_grid,
     _broadcast_2d_to_grid,
 )
+from .utils.utils import center_crop
 
 
 class Field(struct.PyTreeNode):
@@ -94,11 +97,11 @@ class Field(struct.PyTreeNode):
         is the origin and that the elements are sampling from the center, not
         the corner.
         """
-        # We must use meshgrid instead of mgrid here in order to be jittable
+        # The shape is static, so the grid is a constant computed on the host
         N_y, N_x = self.spatial_shape
-        grid = jnp.meshgrid(
-            jnp.linspace(0, (N_y - 1), N_y) - N_y / 2,
-            jnp.linspace(0, (N_x - 1), N_x) - N_x / 2,
+        grid = np.meshgrid(
+            np.linspace(0, (N_y - 1), N_y) - N_y / 2,
+            np.linspace(0, (N_x - 1), N_x) - N_x / 2,
             indexing="ij",
         )
         grid = rearrange(grid, "d h w -> d " + ("1 " * (self.ndim - 4)) + "h w 1 1")
@@ -114,9 +117,9 @@ class Field(struct.PyTreeNode):
         center, not the corner.
         """
         N_y, N_x = self.spatial_shape
-        grid = jnp.meshgrid(
-            jnp.fft.fftshift(jnp.fft.fftfreq(N_y)),
-            jnp.fft.fftshift(jnp.fft.fftfreq(N_x)),
+        grid = np.meshgrid(
+            np.fft.fftshift(np.fft.fftfreq(N_y)),
+            np.fft.fftshift(np.fft.fftfreq(N_x)),
             indexing="ij",
         )
         grid = rearrange(grid, "d h w -> d " + ("1 " * (self.ndim - 4)) + "h w 1 1")
@@ -142,7 +145,7 @@ class Field(struct.PyTreeNode):
         the common case of square pixels). Spacing is the same per wavelength
         for all entries in a batch.
         """
-        shape = jnp.array(self.spatial_shape)
+        shape = np.array(self.spatial_shape)
         shape = _broadcast_1d_to_grid(shape, self.ndim)
         return 1 / (self.dx * shape)
 
@@ -153,7 +156,7 @@ class Field(struct.PyTreeNode):
         shape ``(2 1... 1 1 C 1)`` specifying the surface area in the y and x
         dimensions respectively.
         """
-        shape = jnp.array(self.spatial_shape)
+        shape = np.array(self.spatial_shape)
         shape = _broadcast_1d_to_grid(shape, self.ndim)
         return self.dx * shape
 
@@ -437,10 +440,12 @@ def pad(field: Field, pad_width: Union[int, Tuple[int, int]], cval: float = 0) -
     """
     if isinstance(pad_width, int):
         pad_width = (pad_width, pad_width)
-    u = jnp.pad(
+    if all(n == 0 for n in pad_width):
+        return field
+    u = lax.pad(
         field.u,
-        [(n, n) for n in (0,) * (field.ndim - 4) + (*pad_width, 0, 0)],
-        constant_values=cval,
+        jnp.asarray(cval, dtype=field.u.dtype),
+        [(n, n, 0) for n in (0,) * (field.ndim - 4) + (*pad_width, 0, 0)],
     )
     return field.replace(u=u)
 
@@ -454,11 +459,10 @@ def crop(field: Field, crop_width: Union[int, Tuple[int, int]]) -> Field:
     """
     if isinstance(crop_width, int):
         crop_width = (crop_width, crop_width)
-    crop = [
-        slice(n, size - n)
-        for size, n in zip(field.shape, (0,) * (field.ndim - 4) + (*crop_width, 0, 0))
-    ]
-    return field.replace(u=field.u[tuple(crop)])
+    if all(n == 0 for n in crop_width):
+        return field
+    crop_length = (0,) * (field.ndim - 4) + (*crop_width, 0, 0)
+    return field.replace(u=center_crop(field.u, crop_length))
 
 
 def shift(field: Field, shiftby: Union[int, Tuple[int, int]]) -> Field:
@@ -1,4 +1,5 @@
 import jax.numpy as jnp
+import numpy as np
 
 from chromatix import Field
 from chromatix.utils import _squeeze_grid_to_2d
@@ -33,9 +34,7 @@ def optical_fft(field: Field, z: float, n: float) -> Field:
         (z < 0)
         * -1j  # Sign change because we take the conjugate of the input
         * (L_sq / jnp.prod(du, axis=0, keepdims=False))  # Inverse length scale
-        / jnp.prod(
-            jnp.array(field.shape)  # Due to a different norm factor for fft and ifft
-        )
+        / np.prod(field.shape)  # Due to a different norm factor for fft and ifft
     )
     # Inverse transform input needs to use the conjugate
     fft_input = (norm_fft * field.u) + (norm_ifft * field.conj.u)
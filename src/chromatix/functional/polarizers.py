@@ -1,10 +1,9 @@
 from typing import Union
 
 import jax.numpy as jnp
+import numpy as np
 from chex import Array
 
-from chromatix.utils.utils import matvec
-
 from ..field import VectorField
 
 __all__ = [
@@ -27,6 +26,11 @@ __all__ = [
     "quarterwave_plate",
 ]
 
+# Normalized Jones matrices of the fixed polarizers in yx order (see
+# ``polarizer``), stored as constants so they are not rebuilt on every call
+_LEFT_CIRCULAR = np.array([[1, 1j], [-1j, 1]], dtype=np.complex64) / 2
+_RIGHT_CIRCULAR = np.array([[1, -1j], [1j, 1]], dtype=np.complex64) / 2
+
 
 def jones_vector(theta: float, beta: float) -> Array:
     """Generates a Jones vector given by [cos(theta), sin(theta)exp(1j*beta)].
@@ -101,9 +105,29 @@ def polarizer(
         VectorField: Field after polarizer.
     """
     # Invert the axes as our order is zyx
-    LP = jnp.array([[0, 0, 0], [0, J11, J10], [0, J01, J00]])
-    LP = LP / jnp.linalg.norm(LP)
-    return field.replace(u=matvec(LP, field.u))
+    J = jnp.array([[J11, J10], [J01, J00]])
+    # Normalize per pixel in case the components vary across the field
+    J = J / jnp.linalg.norm(J, axis=(0, 1))
+    return field.replace(u=_apply_jones_2x2(field.u, J))
+
+
+def _apply_jones_2x2(u: Array, J: Array) -> Array:
+    """
+    Applies the 2x2 Jones matrix ``J`` (in yx order) to the transverse
+    components of ``u``. The z component of a Jones matrix is always zero, so
+    only the yx block is computed and the z component is set to zero. ``J``
+    can either be a ``(2 2)`` matrix or have its entries broadcastable to
+    ``(B... H W C 1)``.
+    """
+    uy, ux = u[..., 1:2], u[..., 2:3]
+    return jnp.concatenate(
+        [
+            jnp.zeros_like(uy),
+            J[0, 0] * uy + J[0, 1] * ux,
+            J[1, 0] * uy + J[1, 1] * ux,
+        ],
+        axis=-1,
+    )
 
 
 def linear_polarizer(field: VectorField, angle: float) -> VectorField:
@@ -118,11 +142,9 @@ def linear_polarizer(field: VectorField, angle: float) -> VectorField:
     """
 
     c, s = jnp.cos(angle), jnp.sin(angle)
-    J00 = c**2
-    J11 = s**2
-    J01 = s * c
-    J10 = J01
-    return polarizer(field, J00, J01, J10, J11)
+    # Already normalized (and in yx order), cast to avoid promoting the field
+    J = jnp.array([[s**2, s * c], [s * c, c**2]]).astype(field.u.dtype)
+    return field.replace(u=_apply_jones_2x2(field.u, J))
 
 
 def left_circular_polarizer(field: VectorField) -> VectorField:
@@ -134,11 +156,7 @@ def left_circular_polarizer(field: VectorField) -> VectorField:
     Returns:
         VectorField: outgoing field.
     """
-    J00 = 1
-    J11 = 1
-    J01 = -1j
-    J10 = 1j
-    return polarizer(field, J00, J01, J10, J11)
+    return field.replace(u=_apply_jones_2x2(field.u, _LEFT_CIRCULAR))
 
 
 def right_circular_polarizer(field: VectorField) -> VectorField:
@@ -151,11 +169,7 @@ def right_circular_polarizer(field: VectorField) -> VectorField:
     Returns:
         The ``Field`` directly after the polarizer.
     """
-    J00 = 1
-    J11 = 1
-    J01 = 1j
-    J10 = -1j
-    return polarizer(field, J00, J01, J10, J11)
+    return field.replace(u=_apply_jones_2x2(field.u, _RIGHT_CIRCULAR))
 
 
 def phase_retarder(
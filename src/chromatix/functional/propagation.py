@@ -1,4 +1,5 @@
-from typing import Literal, Tuple, Union
+from functools import partial
+from typing import Literal, Optional, Tuple, Union
 
 import jax
 import jax.numpy as jnp
@@ -10,10 +11,16 @@ from chromatix.functional.convenience import optical_fft
 from chromatix.utils.fft import fft, ifft
 
 from ..field import Field
-from ..utils import _broadcast_1d_to_grid, _broadcast_1d_to_innermost_batch, l2_sq_norm
+from ..utils import (
+    _broadcast_1d_to_grid,
+    _broadcast_1d_to_innermost_batch,
+    l2_sq_norm,
+    next_order,
+)
 
 __all__ = [
     "transform_propagate",
+    "compute_transform_phases",
     "compute_sas_precompensation",
     "transform_propagate_sas",
     "transfer_propagate",
@@ -37,6 +44,7 @@ def transform_propagate(
     cval: float = 0,
     skip_initial_phase: bool = False,
     skip_final_phase: bool = False,
+    phases: Optional[Tuple[Array, Array]] = None,
 ) -> Field:
     """
     Fresnel propagate ``field`` for a distance ``z`` using transform method.
@@ -63,23 +71,59 @@ def transform_propagate(
         skip_final_phase: Whether to skip the output phase change (after Fourier
             transforming). Defaults to False, in which case the output phase
             change is not skipped.
+        phases: The precomputed input and output phase changes for the padded
+            ``Field`` as returned by ``compute_transform_phases``. Useful to
+            avoid recomputing the phase changes when propagating repeatedly
+            with the same geometry. Defaults to None, in which case the phase
+            changes are computed here.
     """
     field = pad(field, N_pad, cval=cval)
     # Fourier normalization factor
     L_sq = field.spectrum * z / n
     # New field is optical_fft minus -1j factor
     if not skip_initial_phase:
-        # Calculating input phase change (defining Q1)
-        input_phase = (jnp.pi / L_sq) * l2_sq_norm(field.grid)
-        field = field * jnp.exp(1j * input_phase)
+        if phases is None:
+            # Calculating input phase change (defining Q1)
+            input_phase = jnp.exp(1j * (jnp.pi / L_sq) * l2_sq_norm(field.grid))
+        else:
+            input_phase = phases[0]
+        field = field * input_phase
     field = 1j * optical_fft(field, z, n)
-    # Calculating output phase change (defining Q2)
     if not skip_final_phase:
-        output_phase = (jnp.pi / L_sq) * l2_sq_norm(field.grid)
-        field = field * jnp.exp(1j * output_phase)
+        if phases is None:
+            # Calculating output phase change (defining Q2)
+            output_phase = jnp.exp(1j * (jnp.pi / L_sq) * l2_sq_norm(field.grid))
+        else:
+            output_phase = phases[1]
+        field = field * output_phase
     return crop(field, N_pad)
 
 
+def compute_transform_phases(field: Field, z: float, n: float) -> Tuple[Array, Array]:
+    """
+    Compute the input and output phase changes for transform propagation.
+    Returns a tuple of arrays that are multiplied with the incoming ``Field``
+    before the Fourier transform and with the ``Field`` after the Fourier
+    transform respectively, as performed by ``transform_propagate``.
+
+    Args:
+        field: The padded ``Field`` to be propagated, i.e. the incoming
+            ``Field`` after padding it by the ``N_pad`` that will be given to
+            ``transform_propagate``.
+        z: Distance to propagate.
+        n: A float that defines the refractive index of the medium.
+    """
+    # Fourier normalization factor
+    L_sq = field.spectrum * z / n
+    # Calculating input phase change (defining Q1)
+    input_phase = (jnp.pi / L_sq) * l2_sq_norm(field.grid)
+    # Calculating output phase change (defining Q2) on the output grid, which
+    # has the spacing given by optical_fft
+    du = field.dk * jnp.abs(L_sq)
+    output_phase = (jnp.pi / L_sq) * l2_sq_norm(field.grid * (du / field.dx))
+    return jnp.exp(1j * input_phase), jnp.exp(1j * output_phase)
+
+
 def compute_sas_precompensation(
     field: Field,
     z: float,
@@ -100,7 +144,7 @@ def compute_sas_precompensation(
     H_Fr = 1 - jnp.sum(s_sq, axis=0) / 2
     delta_H = W * jnp.exp(1j * kz * (H_AS - H_Fr))
     delta_H = jnp.fft.ifftshift(delta_H, axes=field.spatial_dims)
-    return delta_H
+    return delta_H.astype(_kernel_dtype(field))
 
 
 def transform_propagate_sas(
@@ -173,6 +217,7 @@ def transfer_propagate(
     cval: float = 0,
     kykx: Union[Array, Tuple[float, float]] = (0.0, 0.0),
     mode: Literal["full", "same"] = "full",
+    propagator: Optional[Array] = None,
 ) -> Field:
     """
     Fresnel propagate ``field`` for a distance ``z`` using transfer method. This
@@ -195,9 +240,15 @@ def transfer_propagate(
         mode: Either "full" or "same". If "same", the shape of the output
             ``Field`` will match the shape of the incoming ``Field``. Defaults
             to "full", in which case the output shape will include padding.
+        propagator: A precomputed propagation kernel for the padded ``Field``
+            as returned by ``compute_transfer_propagator``. Useful to avoid
+            recomputing the kernel when propagating repeatedly with the same
+            geometry. If provided, ``z``, ``n``, and ``kykx`` are ignored.
+            Defaults to None, in which case the kernel is computed here.
     """
     field = pad(field, N_pad, cval=cval)
-    propagator = compute_transfer_propagator(field, z, n, kykx)
+    if propagator is None:
+        propagator = compute_transfer_propagator(field, z, n, kykx)
     field = kernel_propagate(field, propagator)
     if mode == "same":
         field = crop(field, N_pad)
@@ -212,6 +263,7 @@ def exact_propagate(
     cval: float = 0,
     kykx: Union[Array, Tuple[float, float]] = (0.0, 0.0),
     mode: Literal["full", "same"] = "full",
+    propagator: Optional[Array] = None,
 ) -> Field:
     """
     Propagate ``field`` for a distance ``z`` using exact transfer method.
@@ -235,9 +287,15 @@ def exact_propagate(
         mode: Either "full" or "same". If "same", the shape of the output
             ``Field`` will match the shape of the incoming ``Field``. Defaults
             to "full", in which case the output shape will include padding.
+        propagator: A precomputed propagation kernel for the padded ``Field``
+            as returned by ``compute_exact_propagator``. Useful to avoid
+            recomputing the kernel when propagating repeatedly with the same
+            geometry. If provided, ``z``, ``n``, and ``kykx`` are ignored.
+            Defaults to None, in which case the kernel is computed here.
     """
     field = pad(field, N_pad, cval=cval)
-    propagator = compute_exact_propagator(field, z, n, kykx)
+    if propagator is None:
+        propagator = compute_exact_propagator(field, z, n, kykx)
     field = kernel_propagate(field, propagator)
     if mode == "same":
         field = crop(field, N_pad)
@@ -254,6 +312,7 @@ def asm_propagate(
     bandlimit: bool = False,
     shift_yx: Union[Array, Tuple[float, float]] = (0.0, 0.0),
     mode: Literal["full", "same"] = "full",
+    propagator: Optional[Array] = None,
 ) -> Field:
     """
     Propagate ``field`` for a distance ``z`` using angular spectrum method.
@@ -283,9 +342,16 @@ def asm_propagate(
         mode: Either "full" or "same". If "same", the shape of the output
             ``Field`` will match the shape of the incoming ``Field``. Defaults
             to "full", in which case the output shape will include padding.
+        propagator: A precomputed propagation kernel for the padded ``Field``
+            as returned by ``compute_asm_propagator``. Useful to avoid
+            recomputing the kernel when propagating repeatedly with the same
+            geometry. If provided, ``z``, ``n``, ``kykx``, ``bandlimit``, and
+            ``shift_yx`` are ignored.
+            Defaults to None, in which case the kernel is computed here.
     """
     field = pad(field, N_pad, cval=cval)
-    propagator = compute_asm_propagator(field, z, n, kykx, bandlimit, shift_yx)
+    if propagator is None:
+        propagator = compute_asm_propagator(field, z, n, kykx, bandlimit, shift_yx)
     field = kernel_propagate(field, propagator)
     if mode == "same":
         field = crop(field, N_pad)
@@ -298,11 +364,37 @@ def kernel_propagate(field: Field, propagator: Array) -> Field:
     (``propagator``). This amounts to performing a Fourier convolution of the
     ``field`` and the ``propagator``.
     """
-    axes = field.spatial_dims
-    u = ifft(fft(field.u, axes=axes) * propagator, axes=axes)
+    u = _kernel_propagate(field.u, propagator, axes=field.spatial_dims)
     return field.replace(u=u)
 
 
+@partial(jax.jit, static_argnames=("axes",))
+def _kernel_propagate(u: Array, propagator: Array, axes: Tuple[int, int]) -> Array:
+    # Jitted on the arrays rather than the ``Field`` (whose static
+    # attributes are unhashable arrays) so that XLA fuses the kernel multiply
+    # into the FFT buffers instead of materializing each intermediate.
+    if jnp.iscomplexobj(u):
+        u = fft(u, axes=axes)
+    else:
+        u = _real_fft(u, axes=axes)
+    return ifft(u * propagator, axes=axes)
+
+
+def _real_fft(u: Array, axes: Tuple[int, int]) -> Array:
+    """
+    Computes the full ``fft2`` of a real ``u`` using the cheaper ``rfft2``.
+    The propagation kernels are not Hermitian, so the missing half of the
+    spectrum is restored from the conjugate symmetry of the real input.
+    """
+    y, x = axes
+    W = u.shape[x]
+    u = jnp.fft.rfft2(u, axes=axes)
+    # F[ky, kx] = conj(F[-ky, -kx]) for the columns rfft2 drops
+    rest = jax.lax.slice_in_dim(u, 1, W - W // 2, axis=x)
+    rest = jnp.conj(jnp.roll(jnp.flip(rest, axis=(y, x)), 1, axis=y))
+    return jnp.concatenate([u, rest], axis=x)
+
+
 def compute_transfer_propagator(
     field: Field,
     z: Union[float, Array],
@@ -324,7 +416,8 @@ def compute_transfer_propagator(
     kykx = _broadcast_1d_to_grid(kykx, field.ndim)
     z = _broadcast_1d_to_innermost_batch(z, field.ndim)
     phase = -jnp.pi * (field.spectrum / n) * z * l2_sq_norm(field.k_grid - kykx)
-    return jnp.fft.ifftshift(jnp.exp(1j * phase), axes=field.spatial_dims)
+    kernel_field = jnp.exp(1j * phase).astype(_kernel_dtype(field))
+    return jnp.fft.ifftshift(kernel_field, axes=field.spatial_dims)
 
 
 def compute_exact_propagator(
@@ -354,6 +447,7 @@ def compute_exact_propagator(
     kernel = jnp.maximum(kernel, 0.0)  # removing evanescent waves
     phase = 2 * jnp.pi * (jnp.abs(z) * n / field.spectrum) * jnp.sqrt(kernel)
     kernel_field = jnp.where(z >= 0, jnp.exp(1j * phase), jnp.conj(jnp.exp(1j * phase)))
+    kernel_field = kernel_field.astype(_kernel_dtype(field))
     return jnp.fft.ifftshift(kernel_field, axes=field.spatial_dims)
 
 
@@ -420,10 +514,20 @@ def compute_asm_propagator(
         H_filter = H_filter_yx[0] * H_filter_yx[1]
         # apply filter
         kernel_field = kernel_field * H_filter
+    kernel_field = kernel_field.astype(_kernel_dtype(field))
     return jnp.fft.ifftshift(kernel_field, axes=field.spatial_dims)
 
 
-def compute_padding_transform(height: int, spectrum: float, dx: float, z: float) -> int:
+def _kernel_dtype(field: Field) -> jnp.dtype:
+    # Kernels are computed from the (possibly double precision)
+    # spectrum and spacing, but are stored in the complex dtype of the field
+    # so that multiplying by them does not promote the field to complex128.
+    return jnp.result_type(field.u.dtype, jnp.complex64)
+
+
+def compute_padding_transform(
+    height: int, spectrum: float, dx: float, z: float, fast_fft_shape: bool = True
+) -> int:
     """
     Automatically compute the padding required for transform propagation.
 
@@ -432,6 +536,13 @@ def compute_padding_transform(height: int, spectrum: float, dx: float, z: float)
         spectrum: spectrum of the field
         dx: spacing of the field
         z: A float that defines the distance to propagate.
+        fast_fft_shape: Whether to further increase the padding so that the
+            padded height is a power of 2 for faster FFTs. Only applies to
+            even heights, as symmetric padding of an odd height always gives
+            an odd size. This can at most double the padded height, which
+            grows the memory of the padded field up to 4x, so it can be
+            disabled if the extra padding causes memory issues. Defaults to
+            ``True``.
     """
     # TODO: works only for square fields
     D = height * dx  # height of field in real coordinates
@@ -439,11 +550,15 @@ def compute_padding_transform(height: int, spectrum: float, dx: float, z: float)
     M = height  # height of field in pixels
     Q = 2 * np.maximum(1.0, M / (4 * Nf))  # minimum pad ratio * 2
     N = (np.ceil((Q * M) / 2) * 2).astype(int)
-    N_pad = (N - M).astype(int)
+    N_pad = int(N - M)
+    if fast_fft_shape:
+        N_pad = _fast_fft_padding(M, N_pad)
     return N_pad
 
 
-def compute_padding_transfer(height: int, spectrum: float, dx: float, z: float) -> int:
+def compute_padding_transfer(
+    height: int, spectrum: float, dx: float, z: float, fast_fft_shape: bool = True
+) -> int:
     """
     Automatically compute the padding required for transfer propagation.
 
@@ -452,6 +567,13 @@ def compute_padding_transfer(height: int, spectrum: float, dx: float, z: float)
         spectrum: spectrum of the field
         dx: spacing of the field
         z: A float that defines the distance to propagate.
+        fast_fft_shape: Whether to further increase the padding so that the
+            padded height is a power of 2 for faster FFTs. Only applies to
+            even heights, as symmetric padding of an odd height always gives
+            an odd size. This can at most double the padded height, which
+            grows the memory of the padded field up to 4x, so it can be
+            disabled if the extra padding causes memory issues. Defaults to
+            ``True``.
     """
     # TODO: works only for square fields
     D = height * dx  # height of field in real coordinates
@@ -459,11 +581,15 @@ def compute_padding_transfer(height: int, spectrum: float, dx: float, z: float)
     M = height  # height of field in pixels
     Q = 2 * np.maximum(1.0, M / (4 * Nf))  # minimum pad ratio * 2
     N = (np.ceil((Q * M) / 2) * 2).astype(int)
-    N_pad = (N - M).astype(int)
+    N_pad = int(N - M)
+    if fast_fft_shape:
+        N_pad = _fast_fft_padding(M, N_pad)
     return N_pad
 
 
-def compute_padding_exact(height: int, spectrum: float, dx: float, z: float) -> int:
+def compute_padding_exact(
+    height: int, spectrum: float, dx: float, z: float, fast_fft_shape: bool = True
+) -> int:
     """
     Automatically compute the padding required for exact propagation.
 
@@ -472,6 +598,13 @@ def compute_padding_exact(height: int, spectrum: float, dx: float, z: float) ->
         spectrum: spectrum of the field
         dx: spacing of the field
         z: A float that defines the distance to propagate.
+        fast_fft_shape: Whether to further increase the padding so that the
+            padded height is a power of 2 for faster FFTs. Only applies to
+            even heights, as symmetric padding of an odd height always gives
+            an odd size. This can at most double the padded height, which
+            grows the memory of the padded field up to 4x, so it can be
+            disabled if the extra padding causes memory issues. Defaults to
+            ``True``.
     """
     # TODO: works only for square fields
     D = height * dx  # height of field in real coordinates
@@ -482,5 +615,16 @@ def compute_padding_exact(height: int, spectrum: float, dx: float, z: float) ->
     # assert scale < 1, "Can't do exact transfer when field.dx < lambda / 2"
     Q = Q / np.sqrt(1 - scale**2)  # minimum pad ratio for exact transfer
     N = (np.ceil((Q * M) / 2) * 2).astype(int)
-    N_pad = (N - M).astype(int)
+    N_pad = int(N - M)
+    if fast_fft_shape:
+        N_pad = _fast_fft_padding(M, N_pad)
     return N_pad
+
+
+def _fast_fft_padding(height: int, N_pad: int) -> int:
+    # Padding is applied on both sides, so we round up the total padded height.
+    # Odd heights stay odd, and rounding to 2^k - 1 would give large prime
+    # factors, so we leave their padding unchanged.
+    if height % 2 != 0:
+        return N_pad
+    return (next_order(height + 2 * N_pad) - height) // 2
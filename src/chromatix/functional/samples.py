@@ -3,6 +3,7 @@ from typing import Optional, Tuple, Union
 import jax
 import jax.numpy as jnp
 from chex import assert_equal_shape, assert_rank
+from einops import rearrange
 from jax import Array
 
 from chromatix.field import crop, pad
@@ -10,11 +11,10 @@ from chromatix.utils.fft import fft, ifft
 
 from ..field import ScalarField, VectorField
 from ..utils import _broadcast_2d_to_spatial, center_pad
-from .polarizers import polarizer
+from .polarizers import _apply_jones_2x2
 from .propagation import (
     compute_asm_propagator,
     compute_exact_propagator,
-    exact_propagate,
     kernel_propagate,
 )
 
@@ -57,7 +57,10 @@ def jones_sample(
     sample = jnp.exp(
         1j * 2 * jnp.pi * (dn + 1j * absorption) * thickness / field.spectrum
     )
-    return polarizer(field, sample[0, 0], sample[0, 1], sample[1, 0], sample[1, 1])
+    # Not normalized like an ideal polarizer, so that absorption is preserved.
+    # Invert the axes as our order is zyx.
+    J = jnp.array([[sample[1, 1], sample[1, 0]], [sample[0, 1], sample[0, 0]]])
+    return field.replace(u=_apply_jones_2x2(field.u, J))
 
 
 def thin_sample(
@@ -92,9 +95,9 @@ def thin_sample(
         field.ndim,
         custom_message="Refractive index must have same ndim as incoming ``Field`.`",
     )
-    sample = jnp.exp(
-        1j * 2 * jnp.pi * (dn + 1j * absorption) * thickness / field.spectrum
-    )
+    # Split into real and imaginary parts to avoid a complex (dn + 1j * absorption)
+    k = 2 * jnp.pi * thickness / field.spectrum
+    sample = jnp.exp(-k * absorption + 1j * k * dn)
     return field * sample
 
 
@@ -108,6 +111,8 @@ def multislice_thick_sample(
     propagator: Optional[Array] = None,
     kykx: Union[Array, Tuple[float, float]] = (0.0, 0.0),
     reverse_propagate_distance: Optional[float] = None,
+    reverse_propagator: Optional[Array] = None,
+    use_scan: bool = False,
 ) -> ScalarField:
     """
     Perturbs incoming ``ScalarField`` as if it went through a thick sample. The
@@ -120,7 +125,8 @@ def multislice_thick_sample(
     slice can be provided. By default, a ``propagator`` is calculated inside
     the function. After passing through all slices, the field is propagated
     backwards to the center of the stack, or by the distances specified by
-    ``reverse_propagate_distance`` if provided.
+    ``reverse_propagate_distance`` if provided. The kernel for this backwards
+    propagation can also be provided as ``reverse_propagator``.
 
     Returns a ``ScalarField`` with the result of the perturbation.
 
@@ -142,6 +148,15 @@ def multislice_thick_sample(
         reverse_propagate_distance: If provided, propagates field at the end
             backwards by this amount from the top of the stack. By default,
             field is propagated backwards to the middle of the sample.
+        reverse_propagator: If provided, the precomputed kernel used for the
+            backwards propagation at the end, in which case
+            ``reverse_propagate_distance`` is ignored. Must be computed for
+            the padded field, e.g. using ``compute_exact_propagator``.
+        use_scan: If ``True``, loops over the slices with ``jax.lax.scan``
+            instead of unrolling the loop. Unrolling is faster for a small
+            number of slices, but compilation time and peak memory grow with
+            the number of slices, so scanning is preferable for thick samples
+            with many slices. Defaults to ``False``.
     """
     assert_equal_shape([absorption_stack, dn_stack])
     field = pad(field, N_pad)
@@ -149,18 +164,45 @@ def multislice_thick_sample(
     dn_stack = center_pad(dn_stack, (0, N_pad, N_pad))
     if propagator is None:
         propagator = compute_exact_propagator(field, thickness_per_slice, n, kykx)
-    # NOTE(ac+dd): Unrolling this loop is much faster than ``jax.scan``-likes.
-    for absorption, dn in zip(absorption_stack, dn_stack):
-        absorption = _broadcast_2d_to_spatial(absorption, field.ndim)
-        dn = _broadcast_2d_to_spatial(dn, field.ndim)
-        field = thin_sample(field, absorption, dn, thickness_per_slice)
-        field = kernel_propagate(field, propagator)
+
+    # Same perturbation as ``thin_sample``, with the stacks broadcast once
+    k = 2 * jnp.pi * thickness_per_slice / field.spectrum
+    shape_spec = "d h w -> d " + ("1 " * (field.ndim - 4)) + "h w 1 1"
+    absorption_stack = rearrange(absorption_stack, shape_spec)
+    dn_stack = rearrange(dn_stack, shape_spec)
+    # Every slice keeps the complex dtype of the field and propagator, so a
+    # float64 spectrum does not promote single precision fields
+    dtype = jnp.result_type(field.u, propagator, jnp.complex64)
+    if use_scan:
+        # Computes each slice's perturbation inside the scan and keeps a single
+        # working field, so memory does not grow with the number of slices
+        def _scan_slice(u: Array, absorption_and_dn: Tuple[Array, Array]):
+            absorption, dn = absorption_and_dn
+            sample = jnp.exp(-k * absorption + 1j * k * dn).astype(dtype)
+            return kernel_propagate(field.replace(u=u * sample), propagator).u, None
+
+        # The carry must already have the dtype of each step's output
+        u = field.u.astype(dtype)
+        u, _ = jax.lax.scan(_scan_slice, u, (absorption_stack, dn_stack))
+        field = field.replace(u=u)
+    else:
+        # Computing the perturbation of all slices at once removes the
+        # per-slice exponentials from the loop
+        sample_stack = jnp.exp(-k * absorption_stack + 1j * k * dn_stack)
+        sample_stack = sample_stack.astype(dtype)
+        # NOTE(ac+dd): Unrolling this loop is much faster than ``jax.scan``-likes.
+        for sample in sample_stack:
+            field = kernel_propagate(field * sample, propagator)
     # Propagate field backwards to the middle (or chosen distance) of the stack
-    if reverse_propagate_distance is None:
-        reverse_propagate_distance = thickness_per_slice * absorption_stack.shape[0] / 2
-    field = exact_propagate(
-        field, z=-reverse_propagate_distance, n=n, kykx=kykx, N_pad=0
-    )
+    if reverse_propagator is None:
+        if reverse_propagate_distance is None:
+            reverse_propagate_distance = (
+                thickness_per_slice * absorption_stack.shape[0] / 2
+            )
+        reverse_propagator = compute_exact_propagator(
+            field, -reverse_propagate_distance, n, kykx
+        )
+    field = kernel_propagate(field, reverse_propagator)
     return crop(field, N_pad)
 
 
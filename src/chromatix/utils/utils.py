@@ -1,11 +1,12 @@
+from functools import lru_cache
 from typing import Optional, Sequence, Tuple, Union
 
-import flax.linen as nn
 import jax.numpy as jnp
 import numpy as np
 from chex import Array
 from einops import rearrange
-from scipy.ndimage import distance_transform_edt  # type: ignore
+from jax import lax
+from scipy.special import expit  # type: ignore
 
 from .shapes import _broadcast_2d_to_spatial
 
@@ -19,8 +20,10 @@ def center_pad(u: jnp.ndarray, pad_width: Sequence[int], cval: float = 0) -> Arr
     Symmetrically pads ``u`` with lengths specified per axis in ``n_padding``,
     which should be iterable and have the same size as ``u.ndims``.
     """
-    pad = [(n, n) for n in pad_width]
-    return jnp.pad(u, pad, constant_values=cval)
+    if all(n == 0 for n in pad_width):
+        return u
+    pad = [(n, n, 0) for n in pad_width]
+    return lax.pad(u, jnp.asarray(cval, dtype=u.dtype), pad)
 
 
 def center_crop(u: jnp.ndarray, crop_length: Sequence[int]) -> Array:
@@ -28,9 +31,20 @@ def center_crop(u: jnp.ndarray, crop_length: Sequence[int]) -> Array:
     Symmetrically crops ``u`` with lengths specified per axis in
     ``crop_length``, which should be iterable with same size as ``u.ndims``.
     """
-    crop_length = [0 if length is None else length for length in crop_length]
-    crop = tuple([slice(n, size - n) for size, n in zip(u.shape, crop_length)])
-    return u[crop]
+    crop_length = tuple(0 if length is None else int(length) for length in crop_length)
+    if all(n == 0 for n in crop_length):
+        return u
+    return lax.slice(u, *_crop_bounds(u.shape, crop_length))
+
+
+@lru_cache(maxsize=256)
+def _crop_bounds(
+    shape: Tuple[int, ...], crop_length: Tuple[int, ...]
+) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Start and stop indices to symmetrically crop an array of ``shape``."""
+    start = tuple(crop_length)
+    stop = tuple(size - n for size, n in zip(shape, crop_length))
+    return start, stop
 
 
 def gaussian_kernel(
@@ -69,15 +83,26 @@ def gaussian_kernel(
     else:
         radius = (truncate * _sigma + 0.5).astype(np.int16)
 
-    x = jnp.mgrid[tuple(slice(-r, r + 1) for r in radius)]
-    phi = jnp.exp(-0.5 * jnp.sum((x.T / _sigma) ** 2, axis=-1))  # type: ignore
-    return phi / phi.sum()
+    # Gaussians are separable, so we only need to evaluate each 1D Gaussian
+    # and take their outer product
+    # Computed on the host with NumPy as the kernel is a constant
+    phi = np.ones(())
+    for r, s in zip(radius, _sigma):
+        x = np.arange(-r, r + 1)
+        phi_1d = np.exp(-0.5 * (x / s) ** 2)
+        phi = phi[..., None] * (phi_1d / phi_1d.sum())
+    return jnp.asarray(phi)
 
 
 def sigmoid_taper(shape: Tuple[int, int], width: float, ndim: int = 5) -> Array:
-    dist = distance_transform_edt(np.pad(np.ones((shape[0] - 2, shape[1] - 2)), 1))
-    taper = 2 * (nn.sigmoid(dist / width) - 0.5)
-    return _broadcast_2d_to_spatial(taper, ndim)
+    # Distance to the nearest edge of the rectangle, which is what a Euclidean
+    # distance transform of the interior (with a zero border) computes
+    y, x = np.arange(shape[0]), np.arange(shape[1])
+    dist_y = np.minimum(y, shape[0] - 1 - y)[:, None]
+    dist_x = np.minimum(x, shape[1] - 1 - x)[None, :]
+    dist = np.minimum(dist_y, dist_x).astype(np.float64)
+    taper = 2 * (expit(dist / width) - 0.5)
+    return jnp.asarray(_broadcast_2d_to_spatial(taper, ndim))
 
 
 def create_grid(shape: Tuple[int, int], spacing: Union[float, Array]) -> Array:
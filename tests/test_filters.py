@@ -12,6 +12,15 @@ def test_gaussian_kernel():
     assert np.allclose(kernel_chromatix, kernel_scipy)
 
 
+def test_anisotropic_gaussian_kernel():
+    kernel_chromatix = gaussian_kernel((1.0, 2.0), truncate=4.0)
+    kernel_scipy = _gaussian_kernel1d(1.0, 0, 4)[:, None] * _gaussian_kernel1d(
+        2.0, 0, 8
+    )
+    assert kernel_chromatix.shape == (9, 17)
+    assert np.allclose(kernel_chromatix, kernel_scipy)
+
+
 @pytest.mark.skip(
     reason="""Locally passes, fails on GH due to 
     scipy gaussian filter giving different results."""
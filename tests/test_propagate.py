@@ -4,6 +4,7 @@ import chromatix.functional as cf
 import jax.numpy as jnp
 import numpy as np
 import pytest
+from chromatix.field import pad
 from scipy.special import fresnel
 
 D = 40
@@ -177,3 +178,59 @@ def test_transform_multiple():
     )
 
     assert field_after_second_propagation.intensity.squeeze()[256, 256] != 0.0
+
+
+def test_precomputed_propagator():
+    shape = (256, 256)
+    N_pad = 128
+    field = cf.plane_wave(
+        shape, D / shape[0], 0.532, 1.0, pupil=partial(cf.square_pupil, w=D)
+    )
+    propagator = cf.compute_exact_propagator(pad(field, N_pad), z, n)
+    out_field = cf.exact_propagate(field, z, n, N_pad=N_pad, mode="same")
+    out_field_precomputed = cf.exact_propagate(
+        field, z, n, N_pad=N_pad, mode="same", propagator=propagator
+    )
+    assert jnp.allclose(out_field.u, out_field_precomputed.u)
+
+
+@pytest.mark.parametrize("shape", [(64, 64), (63, 65)])
+def test_real_field_propagation(shape):
+    field = cf.plane_wave(
+        shape, D / shape[0], 0.532, 1.0, pupil=partial(cf.square_pupil, w=D / 2)
+    )
+    real_field = field.replace(u=jnp.real(field.u))
+    out_field = cf.exact_propagate(real_field.replace(u=real_field.u + 0j), z, n, 0)
+    out_field_real = cf.exact_propagate(real_field, z, n, 0)
+    assert jnp.allclose(out_field.u, out_field_real.u, atol=1e-6)
+
+
+@pytest.mark.parametrize("height", [64, 256, 63, 1023])
+def test_fast_fft_padding(height):
+    for compute_padding in [
+        cf.compute_padding_transform,
+        cf.compute_padding_transfer,
+        cf.compute_padding_exact,
+    ]:
+        N_pad = compute_padding(height, spectrum, 0.3, z)
+        N_pad_minimal = compute_padding(height, spectrum, 0.3, z, fast_fft_shape=False)
+        assert N_pad >= N_pad_minimal
+        padded_height = height + 2 * N_pad
+        if height % 2 == 0:
+            assert padded_height & (padded_height - 1) == 0
+        else:
+            assert N_pad == N_pad_minimal
+
+
+@pytest.mark.parametrize("z", [z, -z])
+def test_precomputed_transform_phases(z):
+    N_pad = 128
+    field = cf.objective_point_source(
+        (256, 256), 0.3, 0.532, 1.0, 0, f=10.0, n=1.0, NA=0.8
+    )
+    phases = cf.compute_transform_phases(pad(field, N_pad), z, n)
+    out_field = cf.transform_propagate(field, z, n, N_pad=N_pad)
+    out_field_precomputed = cf.transform_propagate(
+        field, z, n, N_pad=N_pad, phases=phases
+    )
+    assert jnp.allclose(out_field.u, out_field_precomputed.u, atol=1e-6)
@@ -1,5 +1,11 @@
 import jax.numpy as jnp
-from chromatix.functional.samples import multislice_thick_sample, thin_sample
+from jax.experimental import enable_x64
+from chromatix.functional.polarizers import linear
+from chromatix.functional.samples import (
+    jones_sample,
+    multislice_thick_sample,
+    thin_sample,
+)
 from chromatix.functional.sources import plane_wave
 import pytest
 
@@ -41,6 +47,33 @@ def test_absorption_only_thin_sample():
     assert jnp.allclose(field.u, out_field.u * jnp.e)
 
 
+def test_jones_sample():
+    # diagonal sample, i.e. large absorption for the off-diagonal components
+    field = plane_wave(
+        shape=(16, 16),
+        dx=0.1,
+        spectrum=0.532,
+        spectral_density=1.0,
+        power=1.0,
+        amplitude=linear(jnp.pi / 4),
+        scalar=False,
+    )
+    absorption = jnp.zeros((2, 2, *field.shape[:-1], 1))
+    absorption = absorption.at[0, 1].set(100.0).at[1, 0].set(100.0)
+    dn = jnp.zeros_like(absorption)
+    out_field = jones_sample(field, absorption, dn, thickness=0.532)
+    assert jnp.allclose(field.power, out_field.power)
+    assert jnp.allclose(field.u, out_field.u)
+    # absorption varying per pixel in x only, half cycle delay in y only
+    attenuation = jnp.linspace(0, 1, 16).reshape(1, 1, 16, 1, 1)
+    absorption = absorption.at[0, 0].set(attenuation / (2 * jnp.pi))
+    dn = dn.at[1, 1].set(0.5)
+    out_field = jones_sample(field, absorption, dn, thickness=0.532)
+    assert jnp.allclose(out_field.u[..., 2:], field.u[..., 2:] * jnp.exp(-attenuation))
+    assert jnp.allclose(out_field.u[..., 1:2], -field.u[..., 1:2], atol=1e-6)
+    assert jnp.allclose(out_field.u[..., 0], 0)
+
+
 def test_zero_thick_sample():
     # all zero sample, no effect on incoming field expected
     field = plane_wave(
@@ -94,3 +127,53 @@ def test_phase_delay_thick_sample():
         N_pad=0,
     )
     assert jnp.allclose(field.power, out_field.power)
+
+
+def test_scan_thick_sample():
+    # scanning over slices should match the unrolled loop
+    field = plane_wave(
+        shape=(16, 16), dx=0.1, spectrum=0.532, spectral_density=1.0, power=1.0
+    )
+    absorption = jnp.linspace(0, 0.1, 4 * 16 * 16).reshape(4, 16, 16)
+    dn = jnp.linspace(0, 0.5, 4 * 16 * 16).reshape(4, 16, 16)
+    kwargs = dict(
+        field=field,
+        absorption_stack=absorption,
+        dn_stack=dn,
+        n=1.33,
+        thickness_per_slice=0.532,
+        N_pad=4,
+    )
+    out_field = multislice_thick_sample(**kwargs)
+    out_field_scan = multislice_thick_sample(**kwargs, use_scan=True)
+    assert jnp.allclose(out_field.u, out_field_scan.u, atol=1e-6)
+    # also for real valued fields
+    kwargs["field"] = field.replace(u=jnp.real(field.u))
+    out_field = multislice_thick_sample(**kwargs)
+    out_field_scan = multislice_thick_sample(**kwargs, use_scan=True)
+    assert jnp.allclose(out_field.u, out_field_scan.u, atol=1e-6)
+
+
+@pytest.mark.parametrize("dtype", [jnp.complex64, jnp.float32])
+def test_scan_thick_sample_x64(dtype):
+    # single precision fields should not be promoted by a float64 spectrum
+    with enable_x64():
+        field = plane_wave(
+            shape=(16, 16), dx=0.1, spectrum=0.532, spectral_density=1.0, power=1.0
+        )
+        field = field.replace(u=field.u.real.astype(dtype))
+        absorption = jnp.linspace(0, 0.1, 4 * 16 * 16).reshape(4, 16, 16)
+        dn = jnp.linspace(0, 0.5, 4 * 16 * 16).reshape(4, 16, 16)
+        kwargs = dict(
+            field=field,
+            absorption_stack=absorption,
+            dn_stack=dn,
+            n=1.33,
+            thickness_per_slice=0.532,
+            N_pad=4,
+        )
+        out_field = multislice_thick_sample(**kwargs)
+        out_field_scan = multislice_thick_sample(**kwargs, use_scan=True)
+        assert out_field.u.dtype == jnp.complex64
+        assert out_field_scan.u.dtype == jnp.complex64
+        assert jnp.allclose(out_field.u, out_field_scan.u, atol=1e-6)
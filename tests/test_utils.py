@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+from chromatix.utils import sigmoid_taper
+from scipy.ndimage import distance_transform_edt
+from scipy.special import expit
+
+
+@pytest.mark.parametrize("shape", [(37, 50), (5, 7)])
+def test_sigmoid_taper(shape):
+    taper = sigmoid_taper(shape, 3.0, ndim=5)
+    dist = distance_transform_edt(np.pad(np.ones((shape[0] - 2, shape[1] - 2)), 1))
+    taper_edt = 2 * (expit(dist / 3.0) - 0.5)
+    assert taper.shape == (1, *shape, 1, 1)
+    assert np.allclose(taper.squeeze(), taper_edt)